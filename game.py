@@ -136,6 +136,14 @@ DIRECTION_ALIASES = {
 }
 
 
+# Every accepted (lowercased) spelling mapped straight to its offset so the
+# hot movement path needs a single lookup instead of alias + offset lookups.
+_DIRECTION_LOOKUP = {
+    **DIRECTION_OFFSETS,
+    **{alias: DIRECTION_OFFSETS[key] for alias, key in DIRECTION_ALIASES.items()},
+}
+
+
 def normalize_direction(direction: str) -> str:
     """Return the canonical WASD key for ``direction``.
 
@@ -152,13 +160,14 @@ def normalize_direction(direction: str) -> str:
 def direction_to_offset(direction: str) -> Optional[Tuple[int, int]]:
     """Return the ``(dx, dy)`` offset for ``direction``.
 
-    The helper first normalises the input via :func:`normalize_direction` and
-    then looks up the appropriate offset in :data:`DIRECTION_OFFSETS`.  ``None``
-    is returned when the direction is unknown, allowing callers to handle
-    invalid input uniformly.
+    Accepts the same case insensitive spellings as :func:`normalize_direction`
+    and resolves them through a table precomputed from
+    :data:`DIRECTION_OFFSETS` and :data:`DIRECTION_ALIASES`.  ``None`` is
+    returned when the direction is unknown, allowing callers to handle invalid
+    input uniformly.
     """
 
-    return DIRECTION_OFFSETS.get(normalize_direction(direction))
+    return _DIRECTION_LOOKUP.get(direction.lower())
 
 # Special tile settings
 PHARMACY_SYMBOL = "M"
@@ -54,13 +54,14 @@ class AchievementTracker:
 
     # ------------------------------------------------------------------
     # event handlers
-    def on_zombie_kill(self) -> None:
-        """Handle the event of a zombie being killed."""
+    def on_zombie_kill(self, count: int = 1) -> None:
+        """Handle ``count`` zombies being killed (one by default)."""
 
-        self.zombie_kills += 1
-        if self.zombie_kills == 1:
+        before = self.zombie_kills
+        self.zombie_kills = kills = before + count
+        if before < 1 <= kills:
             self.unlock_achievement(FIRST_BLOOD)
-        if self.zombie_kills >= 50:
+        if kills >= 50:
             self.unlock_achievement(ZOMBIE_SLAYER)
 
     def on_player_death(self) -> None:
@@ -110,7 +110,11 @@ def run_game_cli() -> None:
 
         game_state = GameState(board=board, players=[player], items=board.items, zombies=[])
         game_state.turn = 0
-        manager = TurnManager([player], game_state=game_state)
+        manager = TurnManager(
+            [player],
+            game_state=game_state,
+            on_event=lambda event: print(f"Event: {event.description}"),
+        )
 
         print(tr("starting_scenario").format(name=scenario.name))
         if scenario.description:
@@ -1,28 +1,39 @@
 import random
 import re
-from typing import Tuple
+from functools import lru_cache
+from typing import Optional, Tuple
 
 DICE_RE = re.compile(r'^\s*(\d*)d(\d+)\s*([+-]\s*\d+)?\s*$')
 
 
+@lru_cache(maxsize=64)
+def _parse(dice_notation: str) -> Optional[Tuple[int, int, int]]:
+    """Return ``(count, sides, modifier)`` or ``None`` if not NdM+K notation.
+
+    Games roll the same few expressions (``"1d6"`` every turn) over and over,
+    so the regex work is done once per distinct string.
+    """
+    m = DICE_RE.match(dice_notation)
+    if not m:
+        return None
+    n_str, sides_str, mod_str = m.groups()
+    mod = int(mod_str.replace(" ", "")) if mod_str else 0
+    return (int(n_str) if n_str else 1), int(sides_str), mod
+
+
 def roll(dice_notation: str) -> Tuple[int, str]:
     """Roll dice using NdM+K notation (e.g. "1d6", "2d8+1", "d6-1").
     Returns a tuple of ``(value, detail_string)``.
     """
-    m = DICE_RE.match(dice_notation)
-    if not m:
+    parsed = _parse(dice_notation)
+    if parsed is None:
         # attempt to parse a plain number
         try:
             v = int(dice_notation.strip())
             return v, f"const {v}"
         except ValueError as exc:
             raise ValueError(f"Invalid dice notation: '{dice_notation}'") from exc
-    n_str, sides_str, mod_str = m.groups()
-    n = int(n_str) if n_str else 1
-    sides = int(sides_str)
-    mod = 0
-    if mod_str:
-        mod = int(mod_str.replace(" ", ""))
+    n, sides, mod = parsed
     rolls = [random.randint(1, sides) for _ in range(n)]
     total = sum(rolls) + mod
     detail = f"{n}d{sides}={rolls}"
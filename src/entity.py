@@ -1,6 +1,9 @@
 class Entity:
     """Base entity with position and health."""
 
+    # subclasses that add no ``__slots__`` of their own still get a __dict__
+    __slots__ = ("x", "y", "health")
+
     def __init__(self, x: int = 0, y: int = 0, health: int = 1) -> None:
         self.x = x
         self.y = y
@@ -25,6 +28,10 @@ class Entity:
         """Set health to ``health``."""
         self.health = health
 
+    def take_damage(self, amount: int) -> None:
+        """Reduce health by ``amount``, never dropping below zero."""
+        self.health = max(0, self.health - amount)
+
     def is_alive(self) -> bool:
         """Return ``True`` if the entity has more than zero health."""
         return self.health > 0
@@ -5,6 +5,8 @@ from typing import Dict, Any
 
 from game_board import GameBoard
 
+_encode = json.JSONEncoder(separators=(",", ":")).encode
+
 
 class GameClient:
     """Async client used by players to talk to :class:`GameServer`.
@@ -63,8 +65,8 @@ class GameClient:
                 if not line:
                     break
                 try:
-                    state = json.loads(line.decode("utf-8"))
-                except json.JSONDecodeError:
+                    state = json.loads(line)
+                except ValueError:
                     continue
                 self._apply_state(state)
         finally:
@@ -107,7 +109,7 @@ class GameClient:
 
         if not self.connected or self.writer is None:
             raise ConnectionError("Not connected to server")
-        data = json.dumps(action).encode("utf-8") + b"\n"
+        data = _encode(action).encode("utf-8") + b"\n"
         self.writer.write(data)
         await self.writer.drain()
 
@@ -1,10 +1,13 @@
 import asyncio
 import json
-from typing import Dict, Set
+from typing import Callable, Dict, Set
 
 from game_board import GameBoard
 from player import Player
 
+# one reusable encoder producing compact frames (no spaces after , and :)
+_encode = json.JSONEncoder(separators=(",", ":")).encode
+
 
 class GameServer:
     """Simple asyncio based game server for multiplayer sessions.
@@ -30,6 +33,15 @@ class GameServer:
         # active connections
         self.clients: Set[asyncio.StreamWriter] = set()
         self._server: asyncio.base_events.Server | None = None
+        # encoded state is cached until the next mutation bumps the revision
+        self._state_rev: int = 0
+        self._state_cache: bytes | None = None
+        self._state_cache_rev: int = -1
+        # action name -> handler taking ``(player, msg)``
+        self._dispatch: Dict[str, Callable[[Player, dict], None]] = {
+            "move": self._on_move,
+            "attack": self._on_attack,
+        }
 
     # ------------------------------------------------------------------
     # helper utilities
@@ -41,21 +53,61 @@ class GameServer:
             "players": {id(w): p.to_dict() for w, p in self.players.items()},
         }
 
+    def _mark_dirty(self) -> None:
+        """Invalidate the cached state after the game state was mutated."""
+
+        self._state_rev += 1
+
+    def _encoded_state(self) -> bytes:
+        """Return the newline terminated JSON state, re-encoding only if stale."""
+
+        if self._state_cache is None or self._state_cache_rev != self._state_rev:
+            self._state_cache = (
+                _encode(self._serialise_state()).encode("utf-8") + b"\n"
+            )
+            self._state_cache_rev = self._state_rev
+        return self._state_cache
+
     async def _send_state(self, writer: asyncio.StreamWriter) -> None:
-        data = json.dumps(self._serialise_state()).encode("utf-8") + b"\n"
-        writer.write(data)
+        writer.write(self._encoded_state())
         await writer.drain()
 
+    @staticmethod
+    def _needs_drain(writer: asyncio.StreamWriter) -> bool:
+        """Return ``True`` if awaiting ``writer.drain()`` could block or fail.
+
+        ``drain`` only waits while the transport buffer is above its high-water
+        mark, and only reports a lost connection once the transport is closing;
+        for every other writer it would return immediately.
+        """
+
+        transport = writer.transport
+        if transport.is_closing():
+            return True
+        return transport.get_write_buffer_size() > transport.get_write_buffer_limits()[1]
+
     async def _broadcast_state(self) -> None:
-        data = json.dumps(self._serialise_state()).encode("utf-8") + b"\n"
+        data = self._encoded_state()
+        # queue the frame on every transport first, then only wait for the
+        # clients whose buffers are actually backed up (or closing)
+        pending = []
         for writer in list(self.clients):
-            try:
-                writer.write(data)
-                await writer.drain()
-            except ConnectionResetError:
+            writer.write(data)
+            if self._needs_drain(writer):
+                pending.append(writer)
+        if not pending:
+            return
+        results = await asyncio.gather(
+            *(writer.drain() for writer in pending), return_exceptions=True
+        )
+        for writer, result in zip(pending, results):
+            if isinstance(result, ConnectionResetError):
                 # drop dead connections silently
                 self.clients.discard(writer)
                 self.players.pop(writer, None)
+                self._mark_dirty()
+            elif isinstance(result, BaseException):
+                raise result
 
     # ------------------------------------------------------------------
     # networking
@@ -77,6 +129,7 @@ class GameServer:
         self.board.place_entity(spawn_x, spawn_y, player.symbol)
         player.set_position(spawn_x, spawn_y)
         self.players[writer] = player
+        self._mark_dirty()
 
         await self._send_state(writer)
 
@@ -86,8 +139,10 @@ class GameServer:
                 if not line:
                     break
                 try:
-                    msg = json.loads(line.decode("utf-8"))
-                except json.JSONDecodeError:
+                    # ``json.loads`` decodes UTF-8 bytes itself; invalid
+                    # encodings surface as ``UnicodeDecodeError`` (a ValueError)
+                    msg = json.loads(line)
+                except ValueError:
                     continue  # ignore malformed messages
                 await self._apply_action(msg, writer)
                 await self._broadcast_state()
@@ -97,6 +152,7 @@ class GameServer:
             p = self.players.pop(writer, None)
             if p is not None and self.board.within_bounds(p.x, p.y):
                 self.board.remove_entity(p.x, p.y)
+            self._mark_dirty()
             writer.close()
             try:  # pragma: no cover - network cleanup is best effort
                 await writer.wait_closed()
@@ -114,18 +170,24 @@ class GameServer:
         if player is None:
             return
 
-        action = msg.get("action")
-        if action == "move":
-            dx = int(msg.get("dx", 0))
-            dy = int(msg.get("dy", 0))
-            player.start_turn(1)
-            player.move(dx, dy, self.board)
-        elif action == "attack":  # very lightweight: remove entity if present
-            tx = int(msg.get("x", player.x))
-            ty = int(msg.get("y", player.y))
-            if self.board.within_bounds(tx, ty) and self.board.grid[ty][tx] == "Z":
-                self.board.remove_entity(tx, ty)
-        # ignore unknown actions
+        handler = self._dispatch.get(msg.get("action"))
+        if handler is not None:  # ignore unknown actions
+            handler(player, msg)
+
+    def _on_move(self, player: Player, msg: dict) -> None:
+        dx = int(msg.get("dx", 0))
+        dy = int(msg.get("dy", 0))
+        player.start_turn(1)
+        player.move(dx, dy, self.board)
+        self._mark_dirty()
+
+    def _on_attack(self, player: Player, msg: dict) -> None:
+        # very lightweight: remove entity if present
+        tx = int(msg.get("x", player.x))
+        ty = int(msg.get("y", player.y))
+        if self.board.within_bounds(tx, ty) and self.board.grid[ty][tx] == "Z":
+            self.board.remove_entity(tx, ty)
+            self._mark_dirty()
 
     async def start(self) -> None:
         """Start listening for incoming client connections."""
@@ -15,7 +15,7 @@ import pygame
 from game_client import GameClient
 from dice import roll
 from player import Player
-from zombie import Zombie
+from zombie import Zombie, take_turns
 
 CELL_SIZE = 32
 MARGIN = 200  # width for stats area
@@ -26,6 +26,11 @@ COLORS = {
     "zombie": (200, 30, 30),
     "item": (220, 220, 0),
 }
+GRID_COLOR = (25, 25, 25)
+FLASH_COLOR = (255, 255, 255)
+
+# board symbol -> COLORS key; ``None`` (and anything unknown) is an empty tile
+TILE_KINDS = {None: "empty", "P": "player", "Z": "zombie", "I": "item"}
 
 
 class PygameUI:
@@ -48,6 +53,7 @@ class PygameUI:
         self.font = pygame.font.SysFont("consolas", 18)
 
         self.legend_image = self._create_legend_surface()
+        self.tile_images = self._create_tile_surfaces()
 
         # ------------------------------------------------------------------
         # Local game state used for the demo mode.  A single player is placed on
@@ -73,6 +79,11 @@ class PygameUI:
         # The player starts the first turn with a random number of actions.
         self.player.start_turn(roll("1d6")[0])
 
+        # ``(tile, dest)`` pairs for :meth:`draw_board`, rebuilt only when the
+        # grid differs from the snapshot they were built from.
+        self._blit_seq: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        self._blit_grid: list[list] | None = None
+
         # Flash state used to highlight tiles that were recently attacked.
         self._flash_pos: tuple[int, int] | None = None
         self._flash_until: int = 0
@@ -117,30 +128,41 @@ class PygameUI:
             y += size + pad
         return surf
 
+    def _create_tile_surfaces(self) -> dict:
+        """Pre-render one bordered cell per board symbol for :meth:`draw_board`."""
+        size = self.cell_size
+        tiles = {}
+        for symbol, kind in TILE_KINDS.items():
+            surf = pygame.Surface((size, size))
+            surf.fill(COLORS[kind])
+            pygame.draw.rect(surf, GRID_COLOR, surf.get_rect(), 1)
+            tiles[symbol] = surf
+        return tiles
+
     # ------------------------------------------------------------------
     def draw_board(self) -> None:
-        board = self.client.board
-        now = pygame.time.get_ticks()
-        for y, row in enumerate(board.grid):
-            for x, cell in enumerate(row):
-                rect = pygame.Rect(
-                    x * self.cell_size,
-                    y * self.cell_size,
-                    self.cell_size,
-                    self.cell_size,
-                )
-                color = COLORS["empty"]
-                if cell == "P":
-                    color = COLORS["player"]
-                elif cell == "Z":
-                    color = COLORS["zombie"]
-                elif cell == "I":
-                    color = COLORS["item"]
-                pygame.draw.rect(self.screen, color, rect)
-                # highlight recently attacked tiles
-                if self._flash_pos == (x, y) and now < self._flash_until:
-                    pygame.draw.rect(self.screen, (255, 255, 255), rect, 2)
-                pygame.draw.rect(self.screen, (25, 25, 25), rect, 1)
+        size = self.cell_size
+        grid = self.client.board.grid
+        # most frames show an unchanged board; comparing against a snapshot
+        # is cheaper than rebuilding every pair
+        if grid != self._blit_grid:
+            tiles = self.tile_images
+            empty = tiles[None]
+            self._blit_seq = [
+                (tiles.get(cell, empty), (x * size, y * size))
+                for y, row in enumerate(grid)
+                for x, cell in enumerate(row)
+            ]
+            self._blit_grid = [row[:] for row in grid]
+        # a single ``blits`` call for the whole grid instead of up to three
+        # draw calls per cell
+        self.screen.blits(self._blit_seq, doreturn=False)
+        # highlight the recently attacked tile
+        if self._flash_pos is not None and pygame.time.get_ticks() < self._flash_until:
+            fx, fy = self._flash_pos
+            rect = pygame.Rect(fx * size, fy * size, size, size)
+            pygame.draw.rect(self.screen, FLASH_COLOR, rect, 2)
+            pygame.draw.rect(self.screen, GRID_COLOR, rect, 1)
 
     # ------------------------------------------------------------------
     def draw_stats(self) -> None:
@@ -209,6 +231,29 @@ class PygameUI:
             y += surf.get_height() + 5
         self.screen.blit(self.legend_image, (10, y + 10))
 
+    # ------------------------------------------------------------------
+    def enemy_phase(self) -> None:
+        """Let every zombie act, then resolve their attacks as one batch.
+
+        Zombies decide and move first; the hits they queued are applied
+        afterwards by :func:`zombie.take_turns`.  The board is updated from
+        the positions before and after the batch and the last hit target is
+        flashed.
+        """
+
+        board = self.client.board
+        old_positions = [(z.x, z.y) for z in self.zombies]
+        attacks = take_turns(self.zombies, [self.player], board)
+        for pos in old_positions:
+            board.remove_entity(*pos)
+        for z in self.zombies:
+            if z.health > 0:
+                board.place_entity(z.x, z.y, "Z")
+        if attacks:
+            target = attacks[-1][0]
+            self._flash_pos = (target.x, target.y)
+            self._flash_until = pygame.time.get_ticks() + 200
+
     # ------------------------------------------------------------------
     def run(self) -> None:
         """Main interactive loop.
@@ -272,19 +317,7 @@ class PygameUI:
             # ------------------------------------------------------------------
             # enemy phase
             if self.player.turn_over:
-                for z in list(self.zombies):
-                    old = (z.x, z.y)
-                    adjacent = (
-                        abs(z.x - self.player.x) + abs(z.y - self.player.y) == 1
-                    )
-                    z.take_turn([self.player], self.client.board.grid)
-                    self.client.board.remove_entity(*old)
-                    if z.health > 0:
-                        self.client.board.place_entity(z.x, z.y, "Z")
-                    if adjacent and (z.x, z.y) == old:
-                        self._flash_pos = (self.player.x, self.player.y)
-                        self._flash_until = pygame.time.get_ticks() + 200
-
+                self.enemy_phase()
                 if self.player.health <= 0:
                     running = False
                 else:
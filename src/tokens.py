@@ -1,11 +1,20 @@
+import heapq
 import json
-from typing import Dict, List, Tuple, Any
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 Position = Tuple[int, int]
 
 class TokenManager:
-    """Store tokens/markers on tiles: mapping "x,y" -> list of token dicts.
-    Each token: {"token": str, "duration": Optional[int]}
+    """Store tokens/markers on tiles.
+
+    Each tile ``(x, y)`` maps to two parallel lists: token names and the round
+    in which each token expires (``None`` for permanent tokens).  Expiring
+    tokens are also pushed onto a min-heap keyed by that round, so :meth:`tick`
+    only touches the tokens that actually run out instead of every tile.  The
+    public API still speaks in token dicts
+    ``{"token": str, "duration": Optional[int]}`` with the *remaining*
+    duration; they are only built for callers that ask for them and when
+    serialising, where positions also become ``"x,y"`` strings.
     New features:
       - ``get_symbols_at(pos)``: short string of symbols for map rendering
       - ``apply_enter`` handles new token types ``spike`` and ``dense_smoke``
@@ -20,73 +29,160 @@ class TokenManager:
         "bear_trap": "T",
         "trap": "!",
     }
+    # token -> (trigger type, amount, consumed on enter)
+    TRIGGER_TABLE = {
+        "trap_marker": ("damage", 2, True),
+        "spike": ("damage", 2, True),
+        "bear_trap": ("damage", 3, True),
+        "flag": ("info", 0, False),
+        "smoke": ("info", 0, False),
+        "dense_smoke": ("info", 0, False),
+    }
+    DEFAULT_TRIGGER = ("info", 0, False)
+    # token -> hit threshold penalty while standing in it
+    HIT_MODIFIERS = {"smoke": 1, "dense_smoke": 2}
 
     def __init__(self, tokens: Dict[str, List[Dict[str, Any]]] = None):
-        self._map: Dict[str, List[Dict[str, Any]]] = {}
+        self._map: Dict[Position, Tuple[List[str], List[Optional[int]]]] = {}
+        # rounds elapsed via tick(); expiries are absolute round numbers
+        self._round: int = 0
+        # heap of (expiry round, pos, token); entries whose token was removed
+        # early are skipped lazily when popped
+        self._expiry: List[Tuple[int, Position, str]] = []
+        # summed HIT_MODIFIERS per tile, kept in step with every add/remove
+        self._hit_mod: Dict[Position, int] = {}
+        # pos -> every distinct symbol on the tile, dropped on any change there
+        self._symcache: Dict[Position, str] = {}
+        # token -> tiles holding at least one of it, for area queries
+        self._by_type: Dict[str, Set[Position]] = {}
         if tokens:
-            self._map = {k: list(v) for k, v in tokens.items()}
+            for k, entries in tokens.items():
+                pos = self._parse_key(k)
+                for e in entries:
+                    self.add_token(pos, e.get("token"), e.get("duration"))
 
-    def _key(self, pos: Position) -> str:
-        x, y = pos
-        return f"{x},{y}"
+    @staticmethod
+    def _parse_key(key: str) -> Position:
+        x_str, y_str = key.split(",")
+        return int(x_str), int(y_str)
+
+    def _entries(self, names: List[str], expiries: List[Optional[int]]) -> List[Dict[str, Any]]:
+        rnd = self._round
+        return [
+            {"token": t, "duration": None if e is None else e - rnd}
+            for t, e in zip(names, expiries)
+        ]
 
     def add_token(self, pos: Position, token: str, duration: int = None):
-        k = self._key(pos)
-        self._map.setdefault(k, [])
-        self._map[k].append({"token": token, "duration": int(duration) if duration is not None else None})
+        slot = self._map.get(pos)
+        if slot is None:
+            slot = self._map[pos] = ([], [])
+        slot[0].append(token)
+        self._symcache.pop(pos, None)
+        self._by_type.setdefault(token, set()).add(pos)
+        if duration is None:
+            slot[1].append(None)
+        else:
+            expiry = self._round + int(duration)
+            slot[1].append(expiry)
+            heapq.heappush(self._expiry, (expiry, pos, token))
+        mod = self.HIT_MODIFIERS.get(token)
+        if mod:
+            self._hit_mod[pos] = self._hit_mod.get(pos, 0) + mod
+
+    def _drop(self, pos: Position, slot: Tuple[List[str], List[Optional[int]]], i: int) -> None:
+        """Delete entry ``i`` of the tile ``slot`` at ``pos`` and update indexes."""
+        names, expiries = slot
+        token = names.pop(i)
+        del expiries[i]
+        self._symcache.pop(pos, None)
+        if token not in names:
+            tiles = self._by_type[token]
+            tiles.discard(pos)
+            if not tiles:
+                del self._by_type[token]
+        mod = self.HIT_MODIFIERS.get(token)
+        if mod:
+            left = self._hit_mod[pos] - mod
+            if left:
+                self._hit_mod[pos] = left
+            else:
+                del self._hit_mod[pos]
+        if not names:
+            del self._map[pos]
 
     def remove_token(self, pos: Position, token: str) -> bool:
-        k = self._key(pos)
-        if k in self._map:
-            for entry in list(self._map[k]):
-                if entry.get("token") == token:
-                    self._map[k].remove(entry)
-                    if not self._map[k]:
-                        del self._map[k]
-                    return True
-        return False
+        slot = self._map.get(pos)
+        if slot is None:
+            return False
+        try:
+            i = slot[0].index(token)
+        except ValueError:
+            return False
+        self._drop(pos, slot, i)
+        return True
+
+    def _names_at(self, pos: Position) -> List[str]:
+        """Return the live token-name list at ``pos`` (read-only for callers)."""
+        slot = self._map.get(pos)
+        return slot[0] if slot is not None else []
 
     def get_tokens(self, pos: Position) -> List[Dict[str, Any]]:
-        return [dict(e) for e in self._map.get(self._key(pos), [])]
+        slot = self._map.get(pos)
+        return self._entries(*slot) if slot is not None else []
 
     def list_all(self) -> Dict[Position, List[Dict[str, Any]]]:
-        out: Dict[Position, List[Dict[str, Any]]] = {}
-        for k, lst in self._map.items():
-            x_str, y_str = k.split(",")
-            out[(int(x_str), int(y_str))] = [dict(e) for e in lst]
-        return out
+        return {pos: self._entries(*slot) for pos, slot in self._map.items()}
+
+    def positions_with(self, token: str) -> Set[Position]:
+        """Return every tile holding at least one ``token``."""
+        return set(self._by_type.get(token, ()))
+
+    def positions_within(self, pos: Position, radius: int, token: str) -> Set[Position]:
+        """Return tiles holding ``token`` inside the square of ``radius`` around ``pos``."""
+        tiles = self._by_type.get(token)
+        if not tiles:
+            return set()
+        x, y = pos
+        side = 2 * radius + 1
+        if side * side < len(tiles):
+            # small area on a busy map: probe the box instead of the index
+            return {
+                (bx, by)
+                for bx in range(x - radius, x + radius + 1)
+                for by in range(y - radius, y + radius + 1)
+                if (bx, by) in tiles
+            }
+        return {p for p in tiles if abs(p[0] - x) <= radius and abs(p[1] - y) <= radius}
 
     def tick(self) -> List[Tuple[Position, Dict[str, Any]]]:
-        """Decrease duration for tokens with numeric duration and remove expired ones.
+        """Advance one round and remove tokens whose duration ran out.
         Returns a list of removed tokens ``[(pos, token_entry), ...]``.
         """
+        self._round += 1
+        rnd = self._round
+        heap = self._expiry
         removed = []
-        to_delete = []
-        for k, lst in list(self._map.items()):
-            new_lst = []
-            for entry in lst:
-                dur = entry.get("duration")
-                if dur is None:
-                    new_lst.append(entry)
-                    continue
-                dur -= 1
-                if dur > 0:
-                    new_lst.append({"token": entry["token"], "duration": dur})
-                else:
-                    x_str, y_str = k.split(",")
-                    pos = (int(x_str), int(y_str))
-                    removed.append((pos, {"token": entry["token"], "duration": 0}))
-            if new_lst:
-                self._map[k] = new_lst
-            else:
-                to_delete.append(k)
-        for k in to_delete:
-            if k in self._map:
-                del self._map[k]
+        while heap and heap[0][0] <= rnd:
+            expiry, pos, token = heapq.heappop(heap)
+            slot = self._map.get(pos)
+            if slot is None:
+                continue
+            for i, (t, e) in enumerate(zip(*slot)):
+                if e == expiry and t == token:
+                    break
+            else:  # already removed by remove_token/apply_enter
+                continue
+            self._drop(pos, slot, i)
+            removed.append((pos, {"token": token, "duration": 0}))
         return removed
 
     def to_dict(self) -> Dict[str, Any]:
-        return {"tokens": dict(self._map)}
+        return {
+            "tokens": {
+                f"{x},{y}": self._entries(*slot) for (x, y), slot in self._map.items()
+            }
+        }
 
     @staticmethod
     def from_dict(d: Dict[str, Any]) -> 'TokenManager':
@@ -127,52 +223,38 @@ class TokenManager:
           - ``dense_smoke``  : no damage but makes hits harder (handled elsewhere)
           - ``healing_aura`` : no trigger on enter, heals during cleanup phase
         """
+        slot = self._map.get(pos)
+        if slot is None:
+            return []
         triggers = []
-        for entry in self.get_tokens(pos):
-            t = entry.get("token")
-            if t == "trap_marker":
-                triggers.append({"token": t, "type": "damage", "amount": 2, "consume": True})
-            elif t == "spike":
-                triggers.append({"token": t, "type": "damage", "amount": 2, "consume": True})
-            elif t == "bear_trap":
-                triggers.append({"token": t, "type": "damage", "amount": 3, "consume": True})
-            elif t == "flag":
-                triggers.append({"token": t, "type": "info", "amount": 0, "consume": False})
-            elif t == "smoke":
-                triggers.append({"token": t, "type": "info", "amount": 0, "consume": False})
-            elif t == "dense_smoke":
-                triggers.append({"token": t, "type": "info", "amount": 0, "consume": False})
-            else:
-                triggers.append({"token": t, "type": "info", "amount": 0, "consume": False})
-        # remove consumed tokens
-        for trig in list(triggers):
-            if trig.get("consume"):
-                self.remove_token(pos, trig["token"])
+        consumed: List[int] = []
+        for i, t in enumerate(slot[0]):
+            typ, amount, consume = self.TRIGGER_TABLE.get(t, self.DEFAULT_TRIGGER)
+            triggers.append({"token": t, "type": typ, "amount": amount, "consume": consume})
+            if consume:
+                consumed.append(i)
+        # remove consumed tokens, back to front so indices stay valid
+        for i in reversed(consumed):
+            self._drop(pos, slot, i)
         return triggers
 
     def get_hit_threshold_modifier(self, attacker_pos: Position, defender_pos: Position) -> int:
         """Return modifier for hit threshold added to the base value.
         Smoke on attacker/defender -> +1, dense_smoke -> +2.
         """
-        mod = 0
-        for pos in (attacker_pos, defender_pos):
-            for entry in self.get_tokens(pos):
-                if entry.get("token") == "smoke":
-                    mod += 1
-                if entry.get("token") == "dense_smoke":
-                    mod += 2
-        return mod
+        hit_mod = self._hit_mod
+        return hit_mod.get(attacker_pos, 0) + hit_mod.get(defender_pos, 0)
 
     def get_symbols_at(self, pos: Position, max_symbols: int = 2) -> str:
         """Return a short string representing tokens on a tile.
         Limited to ``max_symbols`` characters for compactness.
         """
-        syms: List[str] = []
-        for entry in self.get_tokens(pos):
-            t = entry.get("token")
-            sym = self.SYMBOLS.get(t, "?")
-            if sym not in syms:
-                syms.append(sym)
-            if len(syms) >= max_symbols:
-                break
-        return "".join(syms)
\ No newline at end of file
+        cached = self._symcache.get(pos)
+        if cached is None:
+            syms: List[str] = []
+            for t in self._names_at(pos):
+                sym = self.SYMBOLS.get(t, "?")
+                if sym not in syms:
+                    syms.append(sym)
+            cached = self._symcache[pos] = "".join(syms)
+        return cached[:max_symbols]
\ No newline at end of file
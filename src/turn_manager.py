@@ -11,12 +11,15 @@ participants and exposes :meth:`start_turn` and :meth:`end_turn` helpers.  The
 former rolls a six sided die to determine how many actions the current
 participant gets.  :meth:`end_turn` advances to the next participant and
 increments the round counter once every participant has acted.  If a game state
-is supplied an end-of-round event is drawn via :meth:`handle_end_of_round`.
+is supplied an end-of-round event is drawn via :meth:`handle_end_of_round` and
+handed to the optional ``on_event`` callback so front ends decide how (and
+whether) to show it.
 """
 
 from __future__ import annotations
 
-from typing import Iterable, List, Optional, Tuple, Any
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import dice
 from event_deck import draw_event, Event, GameState, EventDeck
@@ -37,6 +40,9 @@ class TurnManager:
     event_deck:
         Optional sequence of :class:`event_deck.Event` objects to draw from.  If
         omitted the default event deck is used.
+    on_event:
+        Optional callable receiving each drawn :class:`event_deck.Event`, e.g.
+        to display it.  Without it the event is only logged at debug level.
     """
 
     def __init__(
@@ -44,16 +50,23 @@ class TurnManager:
         participants: Iterable[Any],
         game_state: Optional[GameState] = None,
         event_deck: Optional[EventDeck] = None,
+        on_event: Optional[Callable[[Event], None]] = None,
     ) -> None:
         participants = list(participants)
         if not participants:
             raise ValueError("TurnManager requires at least one participant")
         self._participants: List[Any] = participants
+        # id(participant) -> first index, so start_turn(player) avoids a list
+        # scan; the first occurrence wins, matching ``list.index``
+        self._pos_of: Dict[int, int] = {}
+        for i, p in enumerate(participants):
+            self._pos_of.setdefault(id(p), i)
         self._index: int = 0
         self.round: int = 1
         self.actions_left: int = 0
         self._game_state = game_state
         self._event_deck = event_deck
+        self.on_event = on_event
 
     # ------------------------------------------------------------------
     # helper properties
@@ -89,10 +102,15 @@ class TurnManager:
         """
 
         if player is not None:
-            try:
-                self._index = self._participants.index(player)
-            except ValueError:  # pragma: no cover - defensive programming
-                raise ValueError("Unknown participant") from None
+            idx = self._pos_of.get(id(player))
+            participants = self._participants
+            if idx is None or idx >= len(participants) or participants[idx] is not player:
+                # not an identity hit (e.g. list mutated via ``participants``)
+                try:
+                    idx = participants.index(player)
+                except ValueError:  # pragma: no cover - defensive programming
+                    raise ValueError("Unknown participant") from None
+            self._index = idx
 
         player = self.current_player
         self.actions_left, _ = dice.roll("1d6")
@@ -124,7 +142,9 @@ class TurnManager:
         if self._game_state is None:
             return None
         event = draw_event(self._game_state, self._event_deck)
-        print(f"Event: {event.description}")
+        logging.getLogger(__name__).debug("Event: %s", event.description)
+        if self.on_event is not None:
+            self.on_event(event)
         return None
 
 
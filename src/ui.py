@@ -16,7 +16,13 @@ COLORS = {
     "white": "\x1b[37m",
 }
 
+# (color, bold) -> escape prefix, built once instead of per call
+_PREFIX = {(name, False): code for name, code in COLORS.items()}
+_PREFIX.update({(name, True): BOLD + code for name, code in COLORS.items()})
+
+
 def color(text: str, color: str, bold: bool = False) -> str:
-    code = COLORS.get(color, "")
-    prefix = BOLD + code if bold else code
+    prefix = _PREFIX.get((color, bold))
+    if prefix is None:  # unknown color: keep only the bold flag
+        prefix = BOLD if bold else ""
     return f"{prefix}{text}{RESET}"
@@ -1,14 +1,42 @@
 from entity import Entity
 
 
+def board_bounds(game_board) -> tuple[int, int]:
+    """Return ``(width, height)`` of ``game_board``.
+
+    Plain 2D lists of rows are measured; board objects such as
+    :class:`game_board.GameBoard` already know their ``width``/``height``.
+    """
+
+    if isinstance(game_board, (list, tuple)):
+        height = len(game_board)
+        return (len(game_board[0]) if height > 0 else 0), height
+    return game_board.width, game_board.height
+
+
+# offsets (target - zombie) from which a zombie attacks instead of moving:
+# its own tile and the four orthogonal neighbours (Manhattan distance <= 1)
+_ATTACK_OFFSETS = frozenset({(0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)})
+
+# (sign of dx, sign of dy, x is the dominant axis) -> one-tile step
+_STEP = {
+    (sx, sy, prefer_x): (sx, 0) if prefer_x else (0, sy)
+    for sx in (-1, 0, 1)
+    for sy in (-1, 0, 1)
+    for prefer_x in (True, False)
+}
+
+
 class Zombie(Entity):
     """Basic zombie that only tracks position and health."""
 
+    __slots__ = ("attack_damage",)
+
     def __init__(self, x: int = 0, y: int = 0, health: int = 3):
         super().__init__(x, y, health)
         self.attack_damage = 1
 
-    def take_turn(self, players_list, game_board) -> None:
+    def take_turn(self, players_list, game_board, bounds=None, attacks=None) -> None:
         """Move one step toward the nearest player or attack if adjacent.
 
         The board is represented as a 2D list where the first dimension
@@ -23,43 +51,81 @@ class Zombie(Entity):
             Iterable of player objects.  A player is expected to expose ``x``,
             ``y`` and ``take_damage`` attributes.
         game_board:
-            2D board used to keep the zombie inside bounds.  The structure of
-            the board itself is irrelevant – only its dimensions are used.
+            Board used to keep the zombie inside bounds, either a 2D list of
+            rows or an object with ``width``/``height`` such as
+            :class:`game_board.GameBoard`.  Only its dimensions are used.
+        bounds:
+            Optional precomputed ``(width, height)`` of ``game_board``.  Turn
+            loops moving many zombies pass it (see :func:`take_turns`) so the
+            board is only measured once.
+        attacks:
+            Optional list collecting ``(target, damage)`` pairs.  When given,
+            an attack is queued there instead of being applied immediately so
+            the caller can resolve all hits after every zombie has acted.
         """
 
-        if not players_list:
-            return
-
         # ------------------------------------------------------------------
-        # determine nearest player using Manhattan distance
-        def distance(p):
-            return abs(p.x - self.x) + abs(p.y - self.y)
-
-        target = min(players_list, key=distance)
-        dx = target.x - self.x
-        dy = target.y - self.y
+        # determine nearest player using Manhattan distance (first one wins
+        # ties, like ``min``); the winner's offset is kept from the same pass
+        players = iter(players_list)
+        target = next(players, None)
+        if target is None:
+            return
+        sx, sy = self.x, self.y
+        dx, dy = target.x - sx, target.y - sy
+        best_d = abs(dx) + abs(dy)
+        for p in players:
+            ddx = p.x - sx
+            ddy = p.y - sy
+            d = (ddx if ddx >= 0 else -ddx) + (ddy if ddy >= 0 else -ddy)
+            if d < best_d:
+                target, best_d, dx, dy = p, d, ddx, ddy
 
         # If already adjacent (or on the same tile) attack instead of moving.
-        if abs(dx) + abs(dy) <= 1:
-            # Damage the player and stop. ``take_damage`` is the canonical API
-            # but fall back to ``damage`` if necessary.
-            if hasattr(target, "take_damage"):
+        if (dx, dy) in _ATTACK_OFFSETS:
+            if attacks is not None:
+                attacks.append((target, self.attack_damage))
+            else:
                 target.take_damage(self.attack_damage)
-            elif hasattr(target, "damage"):
-                target.damage(self.attack_damage)
-            else:  # pragma: no cover - defensive
-                target.health = max(0, target.health - self.attack_damage)
             return
 
         # ------------------------------------------------------------------
         # Move one step towards the target.
-        if abs(dx) >= abs(dy):
-            self.x += 1 if dx > 0 else -1
-        else:
-            self.y += 1 if dy > 0 else -1
+        # Step along the dominant axis (ties favour x).
+        step_x, step_y = _STEP[(dx > 0) - (dx < 0), (dy > 0) - (dy < 0), abs(dx) >= abs(dy)]
+        self.x += step_x
+        self.y += step_y
 
         # Keep zombie on the board.
-        height = len(game_board)
-        width = len(game_board[0]) if height > 0 else 0
-        self.x = max(0, min(self.x, width - 1))
-        self.y = max(0, min(self.y, height - 1))
+        width, height = bounds if bounds is not None else board_bounds(game_board)
+        # Plain comparisons instead of nested max/min calls; the upper edge
+        # is checked first so an empty board still clamps to 0.
+        if self.x >= width:
+            self.x = width - 1
+        if self.x < 0:
+            self.x = 0
+        if self.y >= height:
+            self.y = height - 1
+        if self.y < 0:
+            self.y = 0
+
+
+def take_turns(zombies, players_list, game_board) -> list:
+    """Let every zombie in ``zombies`` act once against ``players_list``.
+
+    The board dimensions are measured once for the whole batch instead of
+    once per zombie, and attacks are queued while the zombies decide and
+    resolved together afterwards.  Hits are applied one by one (not summed
+    per player) because armor reduces every individual hit.
+
+    Returns the resolved ``(target, damage)`` pairs in the order the zombies
+    attacked, so callers can react to the hits (e.g. flash the target).
+    """
+
+    bounds = board_bounds(game_board)
+    attacks: list = []
+    for zombie in zombies:
+        zombie.take_turn(players_list, game_board, bounds, attacks)
+    for target, damage in attacks:
+        target.take_damage(damage)
+    return attacks
@@ -12,11 +12,19 @@ def test_first_blood_and_zombie_slayer():
     assert tracker.is_unlocked(FIRST_BLOOD)
     assert not tracker.is_unlocked(ZOMBIE_SLAYER)
 
-    for _ in range(49):
-        tracker.on_zombie_kill()
+    tracker.on_zombie_kill(49)
     assert tracker.is_unlocked(ZOMBIE_SLAYER)
 
 
+def test_batched_kills_notify_once_per_achievement():
+    unlocked = []
+    tracker = AchievementTracker(notifier=unlocked.append)
+    tracker.on_zombie_kill(100)
+    tracker.on_zombie_kill()
+    assert tracker.zombie_kills == 101
+    assert unlocked == [FIRST_BLOOD, ZOMBIE_SLAYER]
+
+
 def test_survivor_unlocked_when_no_deaths():
     tracker = AchievementTracker()
     tracker.on_scenario_win()
@@ -1,8 +1,3 @@
-import os
-import sys
-
-sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
-
 from campaign import Campaign
 from scenario import Scenario
 from game_map import GameMap
@@ -18,3 +18,12 @@ def test_direction_to_offset():
     assert direction_to_offset('e') == (1, 0)
     # unsupported direction returns None
     assert direction_to_offset('upleft') is None
+
+
+def test_direction_to_offset_matches_normalize_for_all_spellings():
+    from game import DIRECTION_ALIASES, DIRECTION_OFFSETS
+
+    for name in list(DIRECTION_OFFSETS) + list(DIRECTION_ALIASES):
+        for spelling in (name, name.upper(), name.capitalize()):
+            expected = DIRECTION_OFFSETS[normalize_direction(spelling)]
+            assert direction_to_offset(spelling) == expected
@@ -1,8 +1,4 @@
 import random
-import os
-import sys
-
-sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
 
 from enemies import Enemy, EnemyManager
 from campaign import Campaign
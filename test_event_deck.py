@@ -1,11 +1,4 @@
-import os
 import random
-import os
-import sys
-
-# Ensure the ``src`` directory is importable when tests are executed from the
-# repository root.  This mirrors the approach used in the existing test suite.
-sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
 
 from event_deck import GameState, load_events, EventDeck, draw_event
 from game_board import GameBoard
@@ -1,9 +1,5 @@
 import asyncio
 import contextlib
-import os
-import sys
-
-sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
 
 from game_server import GameServer
 from game_client import GameClient
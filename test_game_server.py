@@ -0,0 +1,109 @@
+import asyncio
+import json
+
+import pytest
+
+from game_server import GameServer
+from player import Player
+
+
+def test_encoded_state_is_cached_until_mutation():
+    server = GameServer()
+    first = server._encoded_state()
+    assert server._encoded_state() is first
+
+    server.board.place_entity(0, 0, "Z")
+    server._mark_dirty()
+    second = server._encoded_state()
+    assert second is not first
+    assert second.endswith(b"\n")
+
+
+def test_apply_action_dispatches_known_actions():
+    server = GameServer()
+    writer = object()
+    player = Player()
+    server.players[writer] = player
+    server.board.place_entity(1, 0, "Z")
+
+    asyncio.run(server._apply_action({"action": "attack", "x": 1, "y": 0}, writer))
+    assert server.board.is_tile_free(1, 0)
+
+    rev = server._state_rev
+    asyncio.run(server._apply_action({"action": "dance"}, writer))
+    assert server._state_rev == rev
+
+
+def test_encoded_state_is_compact_json():
+    server = GameServer()
+    frame = server._encoded_state()
+    assert b", " not in frame and b'": ' not in frame
+    assert json.loads(frame) == server._serialise_state()
+
+
+class _FakeTransport:
+    def __init__(self, buffered=0, closing=False):
+        self.buffered = buffered
+        self.closing = closing
+
+    def is_closing(self):
+        return self.closing
+
+    def get_write_buffer_size(self):
+        return self.buffered
+
+    def get_write_buffer_limits(self):
+        return 16, 64  # (low, high)
+
+
+class _FakeWriter:
+    def __init__(self, buffered=0, closing=False, error=None):
+        self.transport = _FakeTransport(buffered, closing)
+        self.error = error
+        self.frames = []
+        self.drained = 0
+
+    def write(self, data):
+        self.frames.append(data)
+
+    async def drain(self):
+        self.drained += 1
+        if self.error is not None:
+            raise self.error
+
+
+def _server_with(*writers):
+    server = GameServer()
+    for writer in writers:
+        server.clients.add(writer)
+        server.players[writer] = Player()
+    return server
+
+
+def test_broadcast_only_drains_backed_up_writers():
+    idle, backed_up = _FakeWriter(buffered=10), _FakeWriter(buffered=100)
+    server = _server_with(idle, backed_up)
+
+    asyncio.run(server._broadcast_state())
+    assert idle.frames == backed_up.frames == [server._encoded_state()]
+    assert (idle.drained, backed_up.drained) == (0, 1)
+
+
+def test_broadcast_drops_reset_writers():
+    alive, dead = _FakeWriter(), _FakeWriter(closing=True, error=ConnectionResetError())
+    server = _server_with(alive, dead)
+    rev = server._state_rev
+
+    asyncio.run(server._broadcast_state())
+    assert server.clients == {alive}
+    assert list(server.players) == [alive]
+    assert server._state_rev == rev + 1
+
+
+def test_broadcast_reraises_other_errors():
+    broken = _FakeWriter(buffered=100, error=RuntimeError("boom"))
+    server = _server_with(broken)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(server._broadcast_state())
+    assert broken in server.clients
@@ -1,13 +1,10 @@
 import random
-import os
-import sys
-
-sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
 
 from src.player import Player
 from src.game_board import GameBoard
 from src.zombie import Zombie
 
+
 def test_move_updates_board_and_actions():
     board = GameBoard(3, 3)
     player = Player(0, 0)
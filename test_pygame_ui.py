@@ -0,0 +1,97 @@
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from game_client import GameClient
+from pygame_ui import COLORS, PygameUI
+from zombie import Zombie
+
+
+@pytest.fixture
+def ui(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    ui = PygameUI(GameClient())
+    yield ui
+    pygame.quit()
+
+
+def _set_zombies(ui, *positions):
+    board = ui.client.board
+    for z in ui.zombies:
+        board.remove_entity(z.x, z.y)
+    ui.zombies = [Zombie(x, y) for x, y in positions]
+    for z in ui.zombies:
+        board.place_entity(z.x, z.y, "Z")
+
+
+def test_enemy_phase_moves_zombies_then_resolves_hits(ui):
+    board = ui.client.board
+    _set_zombies(ui, (1, 2), (5, 1))
+    ui.enemy_phase()
+    assert ui.player.get_health() == 4
+    assert [z.get_position() for z in ui.zombies] == [(1, 2), (4, 1)]
+    assert board.grid[1][4] == "Z" and board.grid[1][5] is None
+    assert ui._flash_pos == (1, 1)
+
+
+def test_enemy_phase_without_hits_does_not_flash(ui):
+    _set_zombies(ui, (6, 6))
+    ui.enemy_phase()
+    assert ui.player.get_health() == 5
+    assert ui._flash_pos is None
+
+
+def _reference_board(ui):
+    """Render the board with the original per-cell ``draw.rect`` calls."""
+
+    surf = pygame.Surface(ui.screen.get_size())
+    size = ui.cell_size
+    for y, row in enumerate(ui.client.board.grid):
+        for x, cell in enumerate(row):
+            rect = pygame.Rect(x * size, y * size, size, size)
+            color = COLORS["empty"]
+            if cell == "P":
+                color = COLORS["player"]
+            elif cell == "Z":
+                color = COLORS["zombie"]
+            elif cell == "I":
+                color = COLORS["item"]
+            pygame.draw.rect(surf, color, rect)
+            if ui._flash_pos == (x, y):
+                pygame.draw.rect(surf, (255, 255, 255), rect, 2)
+            pygame.draw.rect(surf, (25, 25, 25), rect, 1)
+    return surf
+
+
+def _board_bytes(ui, surf):
+    board = ui.client.board
+    area = pygame.Rect(0, 0, board.width * ui.cell_size, board.height * ui.cell_size)
+    return pygame.image.tobytes(surf.subsurface(area), "RGB")
+
+
+def test_draw_board_matches_per_cell_rendering(ui):
+    ui._flash_pos = (8, 8)
+    ui._flash_until = pygame.time.get_ticks() + 60_000
+    ui.draw_board()
+
+    at = ui.screen.get_at
+    assert at((16, 16))[:3] == COLORS["empty"]
+    assert at((48, 48))[:3] == COLORS["player"]
+    assert at((8 * 32 + 16, 8 * 32 + 16))[:3] == COLORS["zombie"]
+    assert at((32, 40))[:3] == (25, 25, 25)  # grid line
+    assert at((8 * 32 + 1, 8 * 32 + 16))[:3] == (255, 255, 255)  # flash border
+    assert _board_bytes(ui, ui.screen) == _board_bytes(ui, _reference_board(ui))
+
+
+def test_draw_board_reuses_blit_sequence_until_grid_changes(ui):
+    ui.draw_board()
+    seq = ui._blit_seq
+    ui.draw_board()
+    assert ui._blit_seq is seq
+
+    ui.client.board.place_entity(3, 0, "I")
+    ui.draw_board()
+    assert ui._blit_seq is not seq
+    assert ui.screen.get_at((3 * 32 + 16, 16))[:3] == COLORS["item"]
+    assert _board_bytes(ui, ui.screen) == _board_bytes(ui, _reference_board(ui))
@@ -0,0 +1,129 @@
+from tokens import TokenManager
+
+
+def test_add_get_and_remove_tokens():
+    tm = TokenManager()
+    tm.add_token((1, 2), "smoke", duration=2)
+    tm.add_token((1, 2), "flag")
+    assert tm.get_tokens((1, 2)) == [
+        {"token": "smoke", "duration": 2},
+        {"token": "flag", "duration": None},
+    ]
+    assert tm.remove_token((1, 2), "smoke")
+    assert not tm.remove_token((1, 2), "smoke")
+    assert tm.remove_token((1, 2), "flag")
+    assert tm.list_all() == {}
+
+
+def test_tick_expires_tokens():
+    tm = TokenManager()
+    tm.add_token((0, 0), "smoke", duration=1)
+    tm.add_token((0, 0), "trap_marker")
+    removed = tm.tick()
+    assert removed == [((0, 0), {"token": "smoke", "duration": 0})]
+    assert tm.get_tokens((0, 0)) == [{"token": "trap_marker", "duration": None}]
+
+
+def test_round_trip_uses_string_keys():
+    tm = TokenManager()
+    tm.add_token((3, 4), "spike", duration=3)
+    data = tm.to_dict()
+    assert data == {"tokens": {"3,4": [{"token": "spike", "duration": 3}]}}
+    restored = TokenManager.from_dict(data)
+    assert restored.list_all() == {(3, 4): [{"token": "spike", "duration": 3}]}
+
+
+def test_apply_enter_consumes_traps():
+    tm = TokenManager()
+    tm.add_token((0, 0), "bear_trap")
+    tm.add_token((0, 0), "smoke", duration=2)
+    triggers = tm.apply_enter((0, 0), "player", None)
+    assert {"token": "bear_trap", "type": "damage", "amount": 3, "consume": True} in triggers
+    assert [e["token"] for e in tm.get_tokens((0, 0))] == ["smoke"]
+    assert tm.get_hit_threshold_modifier((0, 0), (5, 5)) == 1
+    assert tm.get_symbols_at((0, 0)) == "~"
+
+
+def test_tick_compacts_only_expired_entries():
+    tm = TokenManager({"0,0": [
+        {"token": "smoke", "duration": 1},
+        {"token": "flag", "duration": None},
+        {"token": "dense_smoke", "duration": 3},
+    ]})
+    tm.tick()
+    assert tm.get_tokens((0, 0)) == [
+        {"token": "flag", "duration": None},
+        {"token": "dense_smoke", "duration": 2},
+    ]
+
+
+def test_apply_enter_consumes_every_stacked_trap():
+    tm = TokenManager()
+    tm.add_token((2, 2), "spike")
+    tm.add_token((2, 2), "flag")
+    tm.add_token((2, 2), "spike")
+    triggers = tm.apply_enter((2, 2), "enemy", None)
+    assert [t["type"] for t in triggers] == ["damage", "info", "damage"]
+    assert tm.get_tokens((2, 2)) == [{"token": "flag", "duration": None}]
+    assert tm.apply_enter((9, 9), "enemy", None) == []
+
+
+def test_tick_reports_remaining_duration_and_skips_removed_tokens():
+    tm = TokenManager()
+    tm.add_token((1, 1), "smoke", duration=3)
+    tm.add_token((1, 1), "spike", duration=2)
+    tm.tick()
+    assert tm.get_tokens((1, 1)) == [
+        {"token": "smoke", "duration": 2},
+        {"token": "spike", "duration": 1},
+    ]
+    tm.apply_enter((1, 1), "player", None)  # consumes the spike early
+    assert tm.tick() == []
+    assert tm.to_dict() == {"tokens": {"1,1": [{"token": "smoke", "duration": 1}]}}
+    assert tm.tick() == [((1, 1), {"token": "smoke", "duration": 0})]
+    assert tm.list_all() == {}
+
+
+def test_hit_threshold_modifier_tracks_smoke_changes():
+    tm = TokenManager({"0,0": [{"token": "dense_smoke", "duration": 1}]})
+    tm.add_token((0, 0), "smoke")
+    tm.add_token((1, 0), "smoke")
+    assert tm.get_hit_threshold_modifier((0, 0), (1, 0)) == 4
+    tm.tick()  # dense smoke dissipates
+    assert tm.get_hit_threshold_modifier((0, 0), (1, 0)) == 2
+    tm.remove_token((1, 0), "smoke")
+    assert tm.get_hit_threshold_modifier((0, 0), (1, 0)) == 1
+    tm.remove_token((0, 0), "smoke")
+    assert tm.get_hit_threshold_modifier((0, 0), (1, 0)) == 0
+
+
+def test_symbols_follow_token_changes():
+    tm = TokenManager()
+    assert tm.get_symbols_at((0, 0)) == ""
+    tm.add_token((0, 0), "flag")
+    tm.add_token((0, 0), "smoke", duration=1)
+    tm.add_token((0, 0), "flag")
+    assert tm.get_symbols_at((0, 0)) == "F~"
+    assert tm.get_symbols_at((0, 0), max_symbols=1) == "F"
+    tm.remove_token((0, 0), "flag")
+    tm.remove_token((0, 0), "flag")
+    assert tm.get_symbols_at((0, 0)) == "~"
+    tm.tick()
+    assert tm.get_symbols_at((0, 0)) == ""
+
+
+def test_area_queries_by_token_type():
+    tm = TokenManager()
+    tm.add_token((0, 0), "smoke")
+    tm.add_token((0, 0), "smoke")
+    tm.add_token((2, 1), "smoke")
+    tm.add_token((5, 5), "smoke")
+    tm.add_token((1, 1), "flag")
+    assert tm.positions_with("smoke") == {(0, 0), (2, 1), (5, 5)}
+    assert tm.positions_within((1, 1), 1, "smoke") == {(0, 0), (2, 1)}
+    assert tm.positions_within((1, 1), 0, "smoke") == set()
+    tm.remove_token((0, 0), "smoke")
+    assert (0, 0) in tm.positions_with("smoke")
+    tm.remove_token((0, 0), "smoke")
+    assert tm.positions_within((1, 1), 1, "smoke") == {(2, 1)}
+    assert tm.positions_with("bear_trap") == set()
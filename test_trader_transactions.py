@@ -1,9 +1,3 @@
-import os
-import sys
-
-
-sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
-
 from inventory import Inventory
 from player import Player
 from trader import Trader
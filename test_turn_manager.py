@@ -1,11 +1,6 @@
 """Tests for the :mod:`turn_manager` module."""
 
-import os
-import sys
-
-# Ensure the ``src`` directory is importable when tests are executed from the
-# repository root, mirroring other tests in this suite.
-sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+import pytest
 
 from event_deck import GameState, Event, EventDeck
 from game_board import GameBoard
@@ -20,35 +15,60 @@ class Dummy:
         self.name = name
 
 
-def test_start_turn_rolls_actions(monkeypatch):
+class _Dice:
+    """Stand-in for the :mod:`dice` module whose roll result is settable."""
+
+    value = 1
+
+    def roll(self, _notation):
+        return self.value, ""
+
+
+@pytest.fixture(scope="module")
+def _dice():
+    """Swap ``turn_manager.dice`` for a :class:`_Dice` once per module."""
+
+    fake = _Dice()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(turn_manager, "dice", fake)
+        yield fake
+
+
+@pytest.fixture
+def dice_roll(_dice, request):
+    """Make the dice roll ``request.param`` (default 1) for the test."""
+
+    _dice.value = getattr(request, "param", 1)
+    return _dice.value
+
+
+@pytest.mark.parametrize(
+    "dice_roll,expected", [(4, 4), (1, 1)], indirect=["dice_roll"]
+)
+def test_start_turn_rolls_actions(dice_roll, expected):
     players = [Dummy("p1")]
     tm = turn_manager.TurnManager(players)
 
-    # Ensure deterministic dice results.
-    monkeypatch.setattr(turn_manager.dice, "roll", lambda _: (4, ""))
-
     player, actions = tm.start_turn()
     assert player is players[0]
-    assert actions == 4
-    assert tm.actions_left == 4
+    assert actions == expected
+    assert tm.actions_left == expected
 
 
-def test_round_progression(monkeypatch):
-    players = [Dummy("p1"), Dummy("p2")]
+@pytest.mark.parametrize("num_players", [1, 2, 3])
+def test_round_progression(dice_roll, num_players):
+    players = [Dummy(f"p{i}") for i in range(1, num_players + 1)]
     tm = turn_manager.TurnManager(players)
 
-    monkeypatch.setattr(turn_manager.dice, "roll", lambda _: (1, ""))
-
-    tm.start_turn()  # p1
-    tm.end_turn()    # switch to p2
-    tm.start_turn()  # p2
-    tm.end_turn()    # new round, back to p1
+    for _ in players:
+        tm.start_turn()
+        tm.end_turn()  # last one wraps around to a new round
 
     assert tm.round == 2
     assert tm.current_player is players[0]
 
 
-def test_end_of_round_triggers_event(monkeypatch, capsys):
+def test_end_of_round_triggers_event(dice_roll):
     board = GameBoard(3, 3)
     p1, p2 = Player(), Player()
     state = GameState(board=board, players=[p1, p2])
@@ -59,9 +79,10 @@ def test_end_of_round_triggers_event(monkeypatch, capsys):
 
     event = Event(event_id="ambush", description="Ambush!", effect=ambush)
     deck = EventDeck({"ambush": event}, {"ambush": 1})
-    tm = turn_manager.TurnManager([p1, p2], game_state=state, event_deck=deck)
-
-    monkeypatch.setattr(turn_manager.dice, "roll", lambda _: (1, ""))
+    drawn = []
+    tm = turn_manager.TurnManager(
+        [p1, p2], game_state=state, event_deck=deck, on_event=drawn.append
+    )
 
     tm.start_turn()
     tm.end_turn()
@@ -70,6 +91,24 @@ def test_end_of_round_triggers_event(monkeypatch, capsys):
 
     assert p1.health == 4
     assert p2.health == 4
-    out = capsys.readouterr().out
-    assert "Ambush!" in out
+    assert [e.description for e in drawn] == ["Ambush!"]
+
+
+@pytest.mark.parametrize("dice_roll", [2], indirect=True)
+def test_start_turn_with_explicit_player(dice_roll):
+    players = [Dummy("p1"), Dummy("p2"), Dummy("p3")]
+    tm = turn_manager.TurnManager(players)
+
+    player, _ = tm.start_turn(players[2])
+    assert player is players[2]
+    assert tm.end_turn() is players[0]
+    assert tm.round == 2
+
+
+def test_start_turn_with_repeated_participant_uses_first_slot(dice_roll):
+    a, b = Dummy("a"), Dummy("b")
+    tm = turn_manager.TurnManager([a, b, a])
 
+    tm.start_turn(a)
+    assert tm.end_turn() is b
+    assert tm.round == 1
@@ -1,10 +1,8 @@
-import os
-import sys
+from types import SimpleNamespace
 
-sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
-
-from zombie import Zombie
+from zombie import Zombie, take_turns
 from player import Player
+from game_board import GameBoard
 
 
 def test_zombie_moves_toward_nearest_player():
@@ -22,3 +20,108 @@ def test_zombie_attacks_adjacent_player():
     zombie.take_turn([player], board)
     assert zombie.get_position() == (1, 0)
     assert player.get_health() == 4
+
+
+def test_take_turns_moves_every_zombie_within_bounds():
+    board = [[0 for _ in range(4)] for _ in range(3)]
+    players = [Player(x=3, y=2)]
+    zombies = [Zombie(x=0, y=0), Zombie(x=0, y=2)]
+    take_turns(zombies, players, board)
+    assert [z.get_position() for z in zombies] == [(1, 0), (1, 2)]
+
+
+def test_zombie_steps_along_dominant_axis():
+    board = [[0 for _ in range(6)] for _ in range(6)]
+    zombie = Zombie(x=3, y=3)
+    zombie.take_turn([Player(x=2, y=0)], board)
+    assert zombie.get_position() == (3, 2)
+    zombie.take_turn([Player(x=0, y=4)], board)
+    assert zombie.get_position() == (2, 2)
+
+
+def test_zombie_is_clamped_to_board():
+    board = [[0 for _ in range(2)] for _ in range(2)]
+    zombie = Zombie(x=1, y=1)
+    zombie.take_turn([Player(x=5, y=1)], board)
+    assert zombie.get_position() == (1, 1)
+    zombie = Zombie(x=0, y=0)
+    zombie.take_turn([Player(x=0, y=-4)], board)
+    assert zombie.get_position() == (0, 0)
+
+
+def test_take_turns_resolves_each_hit_after_all_moves():
+    board = [[0 for _ in range(3)] for _ in range(3)]
+    player = Player(x=1, y=1, health=5)
+    player.armor = 1
+    zombies = [Zombie(x=0, y=1), Zombie(x=2, y=1)]
+    for z in zombies:
+        z.attack_damage = 2
+    take_turns(zombies, [player], board)
+    # armor soaks one point of each hit separately
+    assert player.get_health() == 3
+
+
+def test_zombie_attacks_any_target_with_take_damage():
+    hits = []
+    target = SimpleNamespace(x=1, y=0, take_damage=hits.append)
+    board = [[0 for _ in range(2)] for _ in range(2)]
+    Zombie(x=0, y=0).take_turn([target], board)
+    assert hits == [1]
+
+
+def test_zombie_moves_instead_of_attacking_diagonally():
+    board = [[0 for _ in range(3)] for _ in range(3)]
+    player = Player(x=1, y=1, health=5)
+    zombie = Zombie(x=0, y=0)
+    zombie.take_turn([player], board)
+    assert zombie.get_position() == (1, 0)
+    assert player.get_health() == 5
+
+
+def test_zombies_take_damage_through_entity_api():
+    zombie = Zombie(health=3)
+    zombie.take_damage(2)
+    assert zombie.get_health() == 1
+    zombie.take_damage(5)
+    assert zombie.get_health() == 0
+
+
+def test_zombie_accepts_game_board_objects():
+    board = GameBoard(2, 3)
+    zombie = Zombie(x=1, y=2)
+    zombie.take_turn([Player(x=1, y=-5)], board)
+    assert zombie.get_position() == (1, 1)
+    zombie = Zombie(x=1, y=0)
+    zombie.take_turn([Player(x=9, y=0)], board)
+    assert zombie.get_position() == (1, 0)
+
+
+def test_take_turns_returns_resolved_attacks():
+    board = [[0 for _ in range(3)] for _ in range(3)]
+    player = Player(x=1, y=1, health=5)
+    far = Zombie(x=0, y=0)
+    near = Zombie(x=1, y=0)
+    attacks = take_turns([far, near], [player], board)
+    assert attacks == [(player, 1)]
+    assert far.get_position() == (1, 0)
+    assert player.get_health() == 4
+
+
+def test_zombie_chases_distant_player():
+    board = [[0 for _ in range(5)] for _ in range(5)]
+    player = Player(x=2**31, y=0, health=5)
+    zombie = Zombie(x=2, y=0)
+    zombie.take_turn([player], board)
+    assert zombie.get_position() == (3, 0)
+    assert player.get_health() == 5
+
+
+def test_zombie_accepts_any_iterable_of_players():
+    board = [[0 for _ in range(5)] for _ in range(5)]
+    for players in ({Player(x=3, y=3)}, (Player(x=3, y=3),), (p for p in [Player(x=3, y=3)])):
+        zombie = Zombie(x=0, y=0)
+        zombie.take_turn(players, board)
+        assert zombie.get_position() == (1, 0)
+    zombie = Zombie(x=0, y=0)
+    zombie.take_turn(iter(()), board)
+    assert zombie.get_position() == (0, 0)
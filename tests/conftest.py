@@ -0,0 +1,155 @@
+"""Shared fixtures for the pygame based client tests."""
+
+import copy
+import os
+import sys
+import types
+
+import pytest
+
+
+# pygame module once initialised by pytest_configure, ``None`` without pygame
+_PYGAME = None
+
+
+def pytest_configure(config):
+    """Initialise pygame once, with the dummy SDL drivers, before collection.
+
+    Several client modules build fonts or surfaces at import time, so this
+    has to happen before the test modules are imported.  Tests must not call
+    ``pygame.init()``/``pygame.quit()`` themselves.
+    """
+
+    global _PYGAME
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    try:
+        import pygame
+    except ImportError:  # pure logic tests still run without pygame
+        return
+    pygame.init()
+    pygame.display.init()
+    pygame.font.init()
+    _PYGAME = pygame
+
+
+def pytest_unconfigure(config):
+    if _PYGAME is not None:
+        _PYGAME.quit()
+
+
+@pytest.fixture(scope="session")
+def _pygame():
+    """The session's initialised pygame module (``None`` without pygame)."""
+
+    return _PYGAME
+
+
+@pytest.fixture
+def screen(_pygame):
+    """Tiny display surface for tests that need a video mode set.
+
+    Set per test because other tests may switch the display mode.
+    """
+
+    if _pygame is None:
+        pytest.skip("pygame not installed")
+    return _pygame.display.set_mode((1, 1))
+
+
+def pytest_collection_modifyitems(config, items):
+    """Pin ``serial`` tests to one xdist worker when running in parallel.
+
+    With ``pytest -n auto --dist=loadgroup`` every test in the ``serial``
+    group lands on the same worker; without xdist this is a no-op.
+    """
+
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+    for item in items:
+        if item.get_closest_marker("serial") is not None:
+            item.add_marker(pytest.mark.xdist_group("serial"))
+
+
+class _DummyScene:
+    def __init__(self, app):
+        self.app = app
+
+
+class _DummyNewGame(_DummyScene):
+    pass
+
+
+class _DummyGame(_DummyScene):
+    pass
+
+
+# module name -> attributes of the stub replacing it
+_SCENE_STUBS = {
+    "client.scene_newgame": {"NewGameScene": _DummyNewGame},
+    "client.scene_game": {"GameScene": _DummyGame},
+    "client.scene_replay": {"ReplayScene": object},
+    "client.scene_photo": {"PhotoScene": object},
+}
+
+
+@pytest.fixture(scope="session")
+def client_scene_stubs():
+    """Install light stand-ins for the heavy ``client.scene_*`` modules.
+
+    The stubs are built and put into ``sys.modules`` once per session;
+    whatever was there before is restored afterwards.
+    """
+
+    saved = {name: sys.modules.get(name) for name in _SCENE_STUBS}
+    for name, attrs in _SCENE_STUBS.items():
+        mod = types.ModuleType(name)
+        mod.__dict__.update(attrs)
+        sys.modules[name] = mod
+    yield types.SimpleNamespace(NewGameScene=_DummyNewGame, GameScene=_DummyGame)
+    for name, mod in saved.items():
+        if mod is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = mod
+
+
+@pytest.fixture
+def menu_scene_stub(monkeypatch):
+    """Replace ``client.scene_menu`` for one test (others import the real one)."""
+
+    mod = types.ModuleType("client.scene_menu")
+    mod.MenuScene = object
+    monkeypatch.setitem(sys.modules, "client.scene_menu", mod)
+    return mod
+
+
+# create_game kwargs -> (state, RNG state) generated with seed 0, shared by
+# fresh_state
+_GAME_CACHE = {}
+
+
+@pytest.fixture
+def fresh_state():
+    """Return a factory for seeded ``board.create_game`` states.
+
+    Each distinct set of keyword arguments is generated once per session with
+    ``rules.set_seed(0)``; callers receive a deep copy they are free to mutate.
+    The RNG is restored to where ``create_game`` left it on every call, so
+    tests that keep rolling after setup stay deterministic.
+    """
+
+    from gamecore import board, rules
+
+    def _make(**kwargs):
+        key = tuple(sorted(kwargs.items()))
+        cached = _GAME_CACHE.get(key)
+        if cached is None:
+            rules.set_seed(0)
+            state = board.create_game(**kwargs)
+            cached = _GAME_CACHE[key] = (state, rules.RNG.get_state())
+        state, rng_state = cached
+        rules.RNG.set_state(copy.deepcopy(rng_state))
+        return copy.deepcopy(state)
+
+    return _make
@@ -1,11 +1,4 @@
-import os
-import sys
-import pathlib
 import pygame
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-sys.path.extend([str(ROOT), str(ROOT / "src")])
-os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
-pygame.init()
 from src.client.ui.theme import set_theme, get_theme
 from src.client.ui.widgets import SubtitleBar, HelpOverlay
 from src.client.input import InputManager
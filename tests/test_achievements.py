@@ -1,7 +1,4 @@
-import sys
-import pathlib
-
-sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+import pytest
 
 from gamecore import achievements
 
@@ -22,44 +19,40 @@ class FakeSteam:
         self.stats_calls += 1
 
 
-def setup_function(_):
-    achievements.init(FakeSteam())
+@pytest.fixture
+def steam():
+    fake = FakeSteam()
+    achievements.init(fake)
+    return fake
 
 
-def test_campaign_win_unlocks():
+def test_campaign_win_unlocks(steam):
     achievements.on_campaign_win()
-    steam = achievements._steam  # type: ignore
     assert achievements.ACH_WIN_CAMPAIGN in steam.achievements
     assert steam.stats_calls == 1
 
 
-def test_kill_counter():
+def test_kill_counter(steam):
     for _ in range(100):
         achievements.on_zombie_kill()
-    steam = achievements._steam  # type: ignore
     assert achievements.ACH_KILL_100 in steam.achievements
 
 
-def test_kill_progress():
+def test_kill_progress(steam):
     for _ in range(10):
         achievements.on_zombie_kill()
     progress = dict((aid, prog) for aid, _, prog in achievements.list_achievements())
     assert progress[achievements.ACH_KILL_100] == 0.1
 
 
-def test_four_players_on_start():
+def test_four_players_on_start(steam):
     achievements.on_game_start(4)
-    steam = achievements._steam  # type: ignore
     assert achievements.ACH_FOUR_PLAYERS in steam.achievements
 
 
-def test_no_damage_win():
-    achievements.on_campaign_win()
-    steam = achievements._steam  # type: ignore
-    assert achievements.ACH_WIN_NO_DAMAGE in steam.achievements
-
-    achievements.init(FakeSteam())
-    achievements.on_player_damage()
+@pytest.mark.parametrize("took_damage,unlocked", [(False, True), (True, False)])
+def test_no_damage_win(steam, took_damage, unlocked):
+    if took_damage:
+        achievements.on_player_damage()
     achievements.on_campaign_win()
-    steam = achievements._steam  # type: ignore
-    assert achievements.ACH_WIN_NO_DAMAGE not in steam.achievements
+    assert (achievements.ACH_WIN_NO_DAMAGE in steam.achievements) is unlocked
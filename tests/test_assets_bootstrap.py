@@ -1,18 +1,11 @@
-import sys
-import pathlib
-
-root = pathlib.Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(root))
-sys.path.insert(0, str(root / "src"))
-
 import pygame
+import pytest
 from client.gfx.tileset import Tileset
 from tools import build_tiles
 
 
-def test_assets_bootstrap(tmp_path, monkeypatch):
-    pygame.init()
-    pygame.display.set_mode((1, 1))
+@pytest.mark.parametrize("preexisting", [False, True])
+def test_assets_bootstrap(tmp_path, monkeypatch, screen, preexisting):
     calls = []
 
     def fake_generate(path):
@@ -20,8 +13,10 @@ def test_assets_bootstrap(tmp_path, monkeypatch):
         surf = pygame.Surface((1, 1))
         pygame.image.save(surf, tmp_path / "@.png")
 
+    if preexisting:
+        pygame.image.save(pygame.Surface((1, 1)), tmp_path / "@.png")
     monkeypatch.setattr(build_tiles, "generate", fake_generate)
     Tileset(folder=tmp_path)
-    assert len(calls) == 1
     Tileset(folder=tmp_path)
-    assert len(calls) == 1
+    # tiles are generated at most once, and never if they already exist
+    assert len(calls) == (0 if preexisting else 1)
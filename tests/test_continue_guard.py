@@ -1,57 +1,37 @@
-import sys
 import types
-import pathlib
 
 import pytest
 
 
-BASE = pathlib.Path(__file__).resolve().parents[1]
-if str(BASE / "src") not in sys.path:
-    sys.path.insert(0, str(BASE / "src"))
+# failure mode -> (find_last_save, validate) patches for gamecore.saveio
+SAVE_FAILURES = {
+    "no_save": (lambda: None, None),
+    "invalid_save": (lambda: 1, lambda slot: False),
+}
 
 
-def test_continue_guard(tmp_path, monkeypatch):
-    pygame = pytest.importorskip("pygame")
-    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
-    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
-    pygame.init(); pygame.display.init(); pygame.font.init()
-
-    # stub scenes
-    mod_new = types.ModuleType("client.scene_newgame")
-    class DummyNew:
-        def __init__(self, app):
-            self.app = app
-    mod_new.NewGameScene = DummyNew
-    sys.modules["client.scene_newgame"] = mod_new
-
-    mod_game = types.ModuleType("client.scene_game")
-    class DummyGame:
-        def __init__(self, app):
-            self.app = app
-    mod_game.GameScene = DummyGame
-    sys.modules["client.scene_game"] = mod_game
-
+def _menu_after_continue(monkeypatch, failure):
+    pytest.importorskip("pygame")
     from client.scene_menu import MenuScene
 
-    app = types.SimpleNamespace()
-    menu = MenuScene(app)
-
-    # pretend no save exists
-    monkeypatch.setattr("gamecore.saveio.find_last_save", lambda: None)
-
+    menu = MenuScene(types.SimpleNamespace())
+    find_last_save, validate = SAVE_FAILURES[failure]
+    monkeypatch.setattr("gamecore.saveio.find_last_save", find_last_save)
+    if validate is not None:
+        monkeypatch.setattr("gamecore.saveio.validate", validate)
     menu._continue()
-    assert menu.next_scene is None
-    assert menu.error_modal is not None
-    menu.error_modal.on_yes()
-    assert isinstance(menu.next_scene, DummyNew)
-    assert menu.error_modal is None
+    return menu
 
-    # now pretend the last save is invalid
-    menu.next_scene = None
-    monkeypatch.setattr("gamecore.saveio.find_last_save", lambda: 1)
-    monkeypatch.setattr("gamecore.saveio.validate", lambda slot: False)
 
-    menu._continue()
+@pytest.mark.parametrize("failure", sorted(SAVE_FAILURES))
+def test_continue_guard(monkeypatch, client_scene_stubs, failure):
+    menu = _menu_after_continue(monkeypatch, failure)
     assert menu.next_scene is None
     assert menu.error_modal is not None
 
+
+def test_continue_without_save_offers_new_game(monkeypatch, client_scene_stubs):
+    menu = _menu_after_continue(monkeypatch, "no_save")
+    menu.error_modal.on_yes()
+    assert isinstance(menu.next_scene, client_scene_stubs.NewGameScene)
+    assert menu.error_modal is None
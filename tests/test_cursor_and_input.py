@@ -1,19 +1,8 @@
-import sys
-import pathlib
-
 import pytest
 
 
-BASE = pathlib.Path(__file__).resolve().parents[1]
-if str(BASE / "src") not in sys.path:
-    sys.path.insert(0, str(BASE / "src"))
-
-
 def test_cursor_and_input(monkeypatch):
     pygame = pytest.importorskip("pygame")
-    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
-    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
-    pygame.init(); pygame.display.init(); pygame.font.init()
 
     from client.app import App
 
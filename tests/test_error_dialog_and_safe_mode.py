@@ -1,34 +1,10 @@
-import os
-import pathlib
-import sys
-import types
-
 import pytest
 
-BASE = pathlib.Path(__file__).resolve().parents[1]
-if str(BASE / "src") not in sys.path:
-    sys.path.insert(0, str(BASE / "src"))
-if str(BASE) not in sys.path:
-    sys.path.insert(0, str(BASE))
-
 
-def test_error_dialog_and_safe_mode(tmp_path, monkeypatch):
-    pygame = pytest.importorskip("pygame")
-    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
-    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+def test_error_dialog_and_safe_mode(tmp_path, monkeypatch, client_scene_stubs):
+    pytest.importorskip("pygame")
     monkeypatch.setenv("HOME", str(tmp_path))
     monkeypatch.setenv("USERPROFILE", str(tmp_path))
-    pygame.init()
-    pygame.display.init()
-    pygame.font.init()
-
-    # stub optional modules used during init
-    stub_replay = types.ModuleType("client.scene_replay")
-    stub_replay.ReplayScene = object
-    sys.modules["client.scene_replay"] = stub_replay
-    stub_photo = types.ModuleType("client.scene_photo")
-    stub_photo.PhotoScene = object
-    sys.modules["client.scene_photo"] = stub_photo
     monkeypatch.setattr("client.app.telemetry_init", lambda cfg: None)
     monkeypatch.setattr("client.app.telemetry_shutdown", lambda reason: None)
     monkeypatch.setattr("client.app.steam.on_join_request", lambda cb: None)
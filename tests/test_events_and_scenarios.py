@@ -1,10 +1,19 @@
 import json
+import types
 
-from gamecore import board as gboard
-from gamecore import events, scenario, rules
+import pytest
 
 
-def test_events_trigger_and_effect(tmp_path):
+@pytest.fixture(scope="module")
+def gc_mods():
+    # imported here so collection (and ``-k`` filtered runs) skip gamecore
+    from gamecore import board, events, rules, scenario
+
+    return types.SimpleNamespace(board=board, events=events, rules=rules, scenario=scenario)
+
+
+def test_events_trigger_and_effect(gc_mods, tmp_path):
+    gboard, events = gc_mods.board, gc_mods.events
     evs = events.load_events()
     assert len(evs) >= 10
     state = gboard.create_game()
@@ -15,7 +24,8 @@ def test_events_trigger_and_effect(tmp_path):
     assert "medkit" in state.current.inventory or state.current.health != 10
 
 
-def test_scenarios_apply():
+def test_scenarios_apply(gc_mods):
+    gboard, scenario, rules = gc_mods.board, gc_mods.scenario, gc_mods.rules
     scens = scenario.load_scenarios()
     assert {"short", "medium", "long"}.issubset(set(scens))
     state = gboard.create_game()
@@ -1,18 +1,7 @@
-import os
-import sys
-import pathlib
-
 import pygame
 
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-sys.path.extend([str(ROOT), str(ROOT / "src")])
-
-os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
-pygame.init()
-pygame.font.init()
-
-import client.ui.widgets as uiw  # noqa: E402  pylint: disable=wrong-import-position
-from client.ui.widgets import HoverHints  # noqa: E402  pylint: disable=wrong-import-position
+import client.ui.widgets as uiw
+from client.ui.widgets import HoverHints
 
 
 def test_hover_hints_shadow() -> None:
@@ -1,18 +1,7 @@
-import os
-import sys
-import pathlib
-
 import pygame
 
-
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-sys.path.extend([str(ROOT), str(ROOT / "src")])
-
-os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
-pygame.init()
-
-from client.input_map import InputManager  # noqa: E402  pylint: disable=wrong-import-position
-from client.ui import widgets  # noqa: E402  pylint: disable=wrong-import-position
+from client.input_map import InputManager
+from client.ui import widgets
 
 
 def test_defaults_and_get_set() -> None:
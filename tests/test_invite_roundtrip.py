@@ -1,8 +1,3 @@
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
-
 from server.invite import create_invite
 from net.serialization import parse_invite_url
 from net.attestation import verify_invite
@@ -1,10 +1,6 @@
 import time
-import sys
-from pathlib import Path
 import pytest
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
-
 from net.attestation import sign_invite, verify_invite
 
 
@@ -18,20 +14,35 @@ def _payload(exp: int) -> dict:
     }
 
 
-def test_invite_signature_and_expiry() -> None:
-    secret = b"secret"
+@pytest.fixture(scope="module")
+def secret() -> bytes:
+    return b"secret"
+
+
+@pytest.fixture(scope="module")
+def signed_valid(secret: bytes) -> tuple[dict, str]:
     payload = _payload(int(time.time()) + 60)
-    sig = sign_invite(payload, secret)
+    return payload, sign_invite(payload, secret)
+
+
+@pytest.fixture
+def invalid_invite(request, secret: bytes, signed_valid: tuple[dict, str]):
+    payload, sig = signed_valid
+    if request.param == "expired":
+        payload = _payload(int(time.time()) - 1)
+        sig = sign_invite(payload, secret)
+    elif request.param == "tampered":
+        payload = dict(payload, room="2")
+    return payload, sig
+
+
+def test_valid_invite_verifies(signed_valid: tuple[dict, str], secret: bytes) -> None:
+    payload, sig = signed_valid
     assert verify_invite(payload, sig, secret)
 
-    # expired
-    expired = _payload(int(time.time()) - 1)
-    sig2 = sign_invite(expired, secret)
-    with pytest.raises(ValueError):
-        verify_invite(expired, sig2, secret)
 
-    # tamper
-    bad = dict(payload)
-    bad["room"] = "2"
+@pytest.mark.parametrize("invalid_invite", ["expired", "tampered"], indirect=True)
+def test_invalid_invite_is_rejected(invalid_invite: tuple[dict, str], secret: bytes) -> None:
+    payload, sig = invalid_invite
     with pytest.raises(ValueError):
-        verify_invite(bad, sig, secret)
+        verify_invite(payload, sig, secret)
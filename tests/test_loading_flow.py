@@ -1,28 +1,11 @@
 from __future__ import annotations
 
-import sys
-import pathlib
-import types
-
 import pytest
 
-BASE = pathlib.Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(BASE / "src"))
-sys.path.insert(0, str(BASE))
-
 
-def test_loading_flow(monkeypatch, tmp_path):
+def test_loading_flow(monkeypatch, tmp_path, menu_scene_stub):
     pygame = pytest.importorskip("pygame")
-    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
-    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
     monkeypatch.setenv("HOME", str(tmp_path))
-    pygame.init()
-    pygame.font.init()
-
-    # stub menu scene to avoid heavy imports
-    stub_menu = types.ModuleType("client.scene_menu")
-    stub_menu.MenuScene = object
-    sys.modules["client.scene_menu"] = stub_menu
 
     from client.scene_loading import LoadingScene
     from client.async_loader import AsyncLoader
@@ -1,16 +1,10 @@
 from __future__ import annotations
 
-import sys
-import pathlib
-
-sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
-
 from gamecore import board, rules, saveio
 
 
-def test_local_coop_turns(tmp_path):
-    rules.set_seed(0)
-    state = board.create_game(players=3, mode=rules.GameMode.LOCAL_COOP)
+def test_local_coop_turns(tmp_path, fresh_state):
+    state = fresh_state(players=3, mode=rules.GameMode.LOCAL_COOP)
     for _ in range(5):
         board.end_turn(state)
     path = tmp_path / 'coop.json'
@@ -2,14 +2,17 @@ import json
 from pathlib import Path
 
 
-def _flatten(data, prefix=""):
+def _flatten(data):
     keys = set()
-    for key, value in data.items():
-        name = f"{prefix}{key}"
-        if isinstance(value, dict):
-            keys |= _flatten(value, name + ".")
-        else:
-            keys.add(name)
+    stack = [(data, "")]
+    while stack:
+        node, prefix = stack.pop()
+        for key, value in node.items():
+            name = f"{prefix}.{key}" if prefix else key
+            if isinstance(value, dict):
+                stack.append((value, name))
+            else:
+                keys.add(name)
     return keys
 
 
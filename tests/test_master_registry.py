@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import time
 
+import pytest
+
 from master.registry import LobbyInfo, MasterRegistry
 
 
@@ -43,11 +45,22 @@ def test_heartbeat_and_expire() -> None:
     assert reg.list() == []
 
 
-def test_list_filters() -> None:
+@pytest.fixture(scope="module")
+def filter_reg() -> MasterRegistry:
     reg = MasterRegistry(timeout=100.0, time_func=time.time)
     reg.register(make_info(mode="m1", region="eu"))
     reg.register(make_info(mode="m2", region="us"))
-    assert len(reg.list()) == 2
-    assert len(reg.list(mode="m1")) == 1
-    assert len(reg.list(region="us")) == 1
-    assert len(reg.list(mode="m2", region="eu")) == 0
+    return reg
+
+
+@pytest.mark.parametrize(
+    "filters,count",
+    [
+        ({}, 2),
+        ({"mode": "m1"}, 1),
+        ({"region": "us"}, 1),
+        ({"mode": "m2", "region": "eu"}, 0),
+    ],
+)
+def test_list_filters(filter_reg: MasterRegistry, filters: dict, count: int) -> None:
+    assert len(filter_reg.list(**filters)) == count
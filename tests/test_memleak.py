@@ -1,30 +1,85 @@
 from __future__ import annotations
 
-import pathlib
-import sys
-import os
 import gc
+import os
+
+import pytest
 
-sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+_STATM = "/proc/self/statm"
 
-from gamecore import board, ai, rules
+# current (not peak) RSS is needed: a peak already includes every earlier
+# test in the session and never goes down again
+pytestmark = pytest.mark.skipif(
+    not os.path.exists(_STATM), reason="needs /proc/self/statm for current RSS"
+)
 
 
 def _rss_mb() -> float:
-    with open('/proc/self/statm') as fh:
-        rss = int(fh.readline().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    """Current resident set size in MB, after a full collection."""
+    gc.collect()
+    with open(_STATM) as fh:
+        rss = int(fh.readline().split()[1]) * os.sysconf("SC_PAGE_SIZE")
     return rss / (1024 * 1024)
 
 
-def test_memleak():
-    rules.set_seed(0)
+def _allowed_growth(start_mem: float) -> float:
+    return start_mem * 0.05 + 5
+
+
+def _measure(play_round, rounds: int = 100, warmup: int = 20, window: int = 10):
+    """Run ``play_round`` up to ``rounds`` times; return ``(start, end, run)``.
+
+    After ``warmup`` rounds RSS is sampled every ``window`` rounds.  The loop
+    stops early only when the growth rate over the last two windows,
+    extrapolated to all ``rounds``, stays under half the allowed growth, so a
+    slow leak still runs the full loop and fails the final check.
+    """
     start_mem = _rss_mb()
-    for _ in range(100):
+    samples: list[float] = []
+    run = 0
+    for i in range(rounds):
+        play_round()
+        run = i + 1
+        if i >= warmup and i % window == 0:
+            samples.append(_rss_mb())
+            if len(samples) >= 3:
+                rate = (samples[-1] - samples[-3]) / (2 * window)
+                projected = samples[-1] - start_mem + max(rate, 0.0) * (rounds - run)
+                if projected < _allowed_growth(start_mem) / 2:
+                    break
+    return start_mem, _rss_mb(), run
+
+
+@pytest.mark.serial
+def test_memleak():
+    from gamecore import board, ai, rules
+
+    def play_round() -> None:
         state = board.create_game()
         ai.zombie_turns(state)
         board.end_turn(state)
-        del state
-        gc.collect()
-    end_mem = _rss_mb()
-    allowed = start_mem * 0.05 + 5
-    assert end_mem - start_mem <= allowed
+
+    rules.set_seed(0)
+    start_mem, end_mem, _ = _measure(play_round)
+    assert end_mem - start_mem <= _allowed_growth(start_mem)
+
+
+@pytest.mark.serial
+def test_early_stop_does_not_hide_a_leak():
+    rounds = 100
+    leaked = []
+    # leak twice the allowance over the run, whatever the process RSS is
+    leak_bytes = int(2 * _allowed_growth(_rss_mb()) / rounds * 1024 * 1024)
+
+    def leaky_round() -> None:
+        leaked.append(bytearray(b"\x01") * leak_bytes)
+
+    start_mem, end_mem, run = _measure(leaky_round, rounds=rounds)
+    assert run == rounds
+    assert end_mem - start_mem > _allowed_growth(start_mem)
+
+
+@pytest.mark.serial
+def test_early_stop_when_flat():
+    _, _, run = _measure(lambda: None)
+    assert run < 100
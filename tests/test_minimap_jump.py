@@ -1,13 +1,3 @@
-import os
-import sys
-import pathlib
-import pygame
-
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-sys.path.extend([str(ROOT), str(ROOT / "src")])
-os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
-pygame.init()
-
 from src.client.gfx.camera import SmoothCamera
 from src.client.gfx.tileset import TILE_SIZE
 
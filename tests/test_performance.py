@@ -1,14 +1,12 @@
 from __future__ import annotations
 
-import pathlib
-import sys
 import time
 import os
 
-sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
-
 from gamecore import board, ai, rules
 
+_DIRS = tuple(rules.DIRECTIONS)
+
 
 def _rss_mb() -> float:
     with open('/proc/self/statm') as fh:
@@ -22,7 +20,7 @@ def test_performance():
     frames = 60
     start = time.perf_counter()
     for _ in range(frames):
-        direction = rules.RNG.choice(list(rules.DIRECTIONS))
+        direction = rules.RNG.choice(_DIRS)
         board.player_move(state, direction)
         ai.zombie_turns(state)
         board.end_turn(state)
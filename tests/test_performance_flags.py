@@ -1,10 +1,6 @@
-import sys, pathlib, time
+import time
 import pygame
 
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-sys.path.append(str(ROOT / 'src'))
-sys.path.append(str(ROOT))
-
 from client.gfx.tileset import Tileset, TILE_SIZE
 from client.gfx.layers import Layer
 from client.gfx import postfx
@@ -23,9 +19,7 @@ class DummyCamera:
         return (int(pos[0] * self.zoom), int(pos[1] * self.zoom))
 
 
-def test_fx_off_fast():
-    pygame.init()
-    pygame.display.set_mode((1, 1))
+def test_fx_off_fast(screen):
     board = DummyBoard(50, 50)
     camera = DummyCamera()
     tileset = Tileset()
@@ -39,5 +33,4 @@ def test_fx_off_fast():
         postfx.apply_preset(layers[Layer.TILE], "OFF")
     avg = (time.perf_counter() - start) / frames
     fps = 1.0 / avg if avg else float("inf")
-    pygame.quit()
     assert fps >= 55
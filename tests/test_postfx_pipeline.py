@@ -1,10 +1,7 @@
-import sys, pathlib
 import numpy as np
 import pygame
 
 # Ensure src/ is on path
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-sys.path.append(str(ROOT / 'src'))
 
 from client.gfx import postfx
 
@@ -16,7 +13,6 @@ def make_surface(color):
 
 
 def test_fx_toggle():
-    pygame.init()
     base = make_surface((100, 100, 100))
     cfg_off = {}
     res_off = postfx.apply_chain(base, cfg_off)
@@ -28,4 +24,3 @@ def test_fx_toggle():
     res_on = postfx.apply_chain(base, cfg_on)
     arr_on = pygame.surfarray.array3d(res_on)
     assert not np.array_equal(arr_base, arr_on)
-    pygame.quit()
@@ -1,11 +1,5 @@
 from __future__ import annotations
 
-import pathlib
-import sys
-
-# ensure src on path
-sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
-
 from client.input import InputManager  # noqa
 from gamecore import config as gconfig  # noqa
 
@@ -1,10 +1,6 @@
 from __future__ import annotations
 
 import os
-import pathlib
-import sys
-
-sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
 
 from gamecore import board, rules
 from replay.recorder import Recorder
@@ -1,13 +1,9 @@
 from __future__ import annotations
 
-import sys
-import pathlib
 import os
 
 import pytest
 
-sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
-
 from gamecore import board, rules
 from replay.recorder import Recorder
 from replay.player import Player
@@ -1,15 +1,3 @@
-import os
-import sys
-import pathlib
-
-import pygame
-
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-sys.path.extend([str(ROOT), str(ROOT / "src")])
-
-os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
-pygame.init()
-
 from gamecore import config as gconfig
 
 
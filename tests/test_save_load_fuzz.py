@@ -1,13 +1,11 @@
 from __future__ import annotations
 
-import pathlib
-import sys
 import random
 
-sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
-
 from gamecore import board, ai, rules, saveio
 
+_DIRS = tuple(rules.DIRECTIONS)
+
 
 def test_save_load_fuzz(tmp_path):
     rules.set_seed(0)
@@ -16,7 +14,7 @@ def test_save_load_fuzz(tmp_path):
         h = random.randint(5, 8)
         state = board.create_game(width=w, height=h, zombies=1)
         for _ in range(5):
-            direction = random.choice(list(rules.DIRECTIONS))
+            direction = random.choice(_DIRS)
             board.player_move(state, direction)
             ai.zombie_turns(state)
             board.end_turn(state)
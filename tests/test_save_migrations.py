@@ -1,9 +1,5 @@
 import json
 from pathlib import Path
-import sys
-import pathlib
-
-sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
 
 from gamecore import board, saveio, validate
 
@@ -1,12 +1,4 @@
 from pathlib import Path
-import pathlib
-import sys
-
-BASE = pathlib.Path(__file__).resolve().parents[1]
-if str(BASE / "src") not in sys.path:
-    sys.path.insert(0, str(BASE / "src"))
-if str(BASE) not in sys.path:
-    sys.path.insert(0, str(BASE))
 
 from gamecore import board, rules, saveio, validate
 
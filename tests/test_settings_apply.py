@@ -1,22 +1,11 @@
-import os
-import sys
-import pathlib
-
 import pygame
 
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-sys.path.extend([str(ROOT), str(ROOT / "src")])
-
-os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
-pygame.init()
-pygame.font.init()
-
-import client.app as app_module  # noqa: E402  pylint: disable=wrong-import-position
-from client.app import App  # noqa: E402  pylint: disable=wrong-import-position
-import client.scene_settings as scene_settings  # noqa: E402  pylint: disable=wrong-import-position
-from client.scene_menu import MenuScene  # noqa: E402  pylint: disable=wrong-import-position
-from client.input import InputManager  # noqa: E402  pylint: disable=wrong-import-position
-from client.ui import widgets  # noqa: E402  pylint: disable=wrong-import-position
+import client.app as app_module
+from client.app import App
+import client.scene_settings as scene_settings
+from client.scene_menu import MenuScene
+from client.input import InputManager
+from client.ui import widgets
 
 
 def test_theme_and_scale_applied(monkeypatch) -> None:
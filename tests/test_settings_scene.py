@@ -1,20 +1,10 @@
-import os
-import sys
-import pathlib
 from types import SimpleNamespace
 
 import pygame
 
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-sys.path.extend([str(ROOT), str(ROOT / "src")])
-
-os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
-pygame.init()
-pygame.font.init()
-
-from client import scene_settings  # noqa: E402  pylint: disable=wrong-import-position
-from client.ui import widgets  # noqa: E402  pylint: disable=wrong-import-position
-from client.input_map import InputManager  # noqa: E402  pylint: disable=wrong-import-position
+from client import scene_settings
+from client.ui import widgets
+from client.input_map import InputManager
 
 
 def test_settings_scene(monkeypatch) -> None:
@@ -1,12 +1,7 @@
 from __future__ import annotations
 
-import sys
-import pathlib
-
 import numpy as np
 
-sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
-
 from client import sfx
 
 
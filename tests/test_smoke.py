@@ -1,9 +1,5 @@
 from __future__ import annotations
 
-import sys
-import pathlib
-sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
-
 from gamecore import ai, board, rules, saveio
 
 
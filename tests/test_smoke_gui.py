@@ -1,24 +1,14 @@
 from __future__ import annotations
 
-import os
-import pathlib
 import sys
 import types
 
 import pytest
 
-BASE = pathlib.Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(BASE / 'src'))
-sys.path.insert(0, str(BASE))
-
 
 def test_smoke_gui(tmp_path, monkeypatch):
     pygame = pytest.importorskip('pygame')
-    monkeypatch.setenv('SDL_VIDEODRIVER', 'dummy')
-    monkeypatch.setenv('SDL_AUDIODRIVER', 'dummy')
     monkeypatch.setenv('HOME', str(tmp_path))
-    pygame.init()
-    pygame.font.init()
 
     stub_replay = types.ModuleType('client.scene_replay')
     stub_replay.ReplayScene = object
@@ -45,4 +35,3 @@ def test_smoke_gui(tmp_path, monkeypatch):
         scene.draw(app.screen)
 
     pygame.event.post(pygame.event.Event(pygame.QUIT))
-    pygame.quit()
@@ -1,8 +1,4 @@
 import os
-import sys
-import pathlib
-
-sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
 
 from gamecore import config as gconfig
 
@@ -1,10 +1,3 @@
-import os
-import sys
-import pathlib
-
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-sys.path.extend([str(ROOT), str(ROOT / "src")])
-
 from gamecore import board, rules, validate, i18n, events
 
 i18n.set_language("en")
@@ -1,14 +1,5 @@
-import os
-import sys
-import pathlib
 import pygame
 
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-sys.path.extend([str(ROOT), str(ROOT / "src")])
-os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
-pygame.init()
-pygame.font.init()
-
 from client.app import App
 from client.gfx.camera import SmoothCamera
 from client.gfx.tileset import TILE_SIZE
@@ -1,13 +1,7 @@
-import pathlib
 import sys
 import pygame
-import pytest
 import types
 
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(ROOT / "src"))
-sys.path.insert(0, str(ROOT))
-
 stub_replay = types.ModuleType("client.scene_replay")
 stub_replay.ReplayScene = object
 sys.modules["client.scene_replay"] = stub_replay
@@ -15,21 +9,11 @@ stub_photo = types.ModuleType("client.scene_photo")
 stub_photo.PhotoScene = object
 sys.modules["client.scene_photo"] = stub_photo
 
-pygame.init()
-pygame.font.init()
-
 from client.scene_game import GameScene
 from client.gfx import postfx
 from gamecore import rules
 
 
-@pytest.fixture(autouse=True)
-def _init_pygame(monkeypatch):
-    monkeypatch.setenv('SDL_VIDEODRIVER', 'dummy')
-    yield
-    pygame.quit()
-
-
 def _scene():
     scene = GameScene.__new__(GameScene)
     scene.cfg = {"night_vignette": 0.5}
@@ -1,13 +1,6 @@
-import os
 import sys
-import pathlib
 import pygame
 
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-sys.path.extend([str(ROOT), str(ROOT / "src")])
-os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
-pygame.init()
-
 import types
 
 dummy_replay = types.ModuleType("scene_replay")
@@ -24,7 +17,6 @@ from src.client.ui import widgets
 
 
 def test_float_text_and_highlights_smoke() -> None:
-    pygame.init()
     surf = pygame.Surface((100, 100), pygame.SRCALPHA)
     ft = anim.FloatText("1", (10.5, 10.5))
     ft.update(0.1)